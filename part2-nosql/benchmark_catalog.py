@@ -0,0 +1,185 @@
+"""
+FlexiMart Catalog Benchmark
+===========================
+Compares catalog reads through MongoDB with the in-memory CatalogService for
+the query shapes in mongodb_operations.js (Operations 2, 3 and 5).
+
+Requires a running MongoDB with products_catalog.json imported:
+    mongoimport --db fleximart --collection products --file products_catalog.json --jsonArray
+
+Author: Data Engineering Team
+Date: 2024
+"""
+
+import sys
+import time
+
+from catalog_service import CatalogService
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+MONGO_URI = 'mongodb://localhost:27017/'
+MONGO_DATABASE = 'fleximart'
+MONGO_COLLECTION = 'products'
+
+ITERATIONS = 1000
+
+
+# ============================================================================
+# QUERY SHAPES
+# ============================================================================
+
+def mongo_category_price_filter(collection):
+    """Operation 2 through MongoDB."""
+    return list(collection.find(
+        {'category': 'Electronics', 'price': {'$lt': 50000}},
+        {'name': 1, 'price': 1, 'stock': 1, '_id': 0}
+    ))
+
+
+def mongo_min_rating(collection):
+    """Operation 3 through MongoDB."""
+    return list(collection.aggregate([
+        {'$project': {'name': 1, 'category': 1,
+                      'avg_rating': {'$avg': '$reviews.rating'}}},
+        {'$match': {'avg_rating': {'$gte': 4.0}}},
+        {'$sort': {'avg_rating': -1}}
+    ]))
+
+
+def mongo_category_price_summary(collection):
+    """Operation 5 through MongoDB."""
+    return list(collection.aggregate([
+        {'$group': {'_id': '$category', 'avg_price': {'$avg': '$price'},
+                    'product_count': {'$sum': 1}}},
+        {'$project': {'_id': 0, 'category': '$_id',
+                      'avg_price': {'$round': ['$avg_price', 2]},
+                      'product_count': 1}},
+        {'$sort': {'avg_price': -1}}
+    ]))
+
+
+# ============================================================================
+# BENCHMARK
+# ============================================================================
+
+def time_query(query, iterations=ITERATIONS):
+    """
+    Run a query repeatedly and return the mean latency.
+
+    Parameters:
+        query (callable): Zero-argument function executing the query
+        iterations (int): Number of timed runs
+
+    Returns:
+        float: Mean latency in microseconds
+    """
+    query()  # warm-up (connection pool / query cache)
+    start = time.perf_counter()
+    for _ in range(iterations):
+        query()
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def normalize(rows):
+    """
+    Make MongoDB and service rows comparable.
+
+    Drops _id, rounds floats and sorts the rows, since tied sort keys
+    (e.g. equal average ratings) have no defined order in either source.
+    Value types are kept, so 29990 and 29990.0 do not compare equal.
+
+    Parameters:
+        rows (list): Result dicts from either source
+
+    Returns:
+        list: Sorted rows as tuples of (field, type name, value)
+    """
+    normalized = [tuple(sorted((k, type(v).__name__,
+                                round(v, 6) if isinstance(v, float) else v)
+                               for k, v in row.items() if k != '_id'))
+                  for row in rows]
+    return sorted(normalized, key=repr)
+
+
+def run_benchmark():
+    """Time each query shape against MongoDB and the in-memory service."""
+    try:
+        from pymongo import MongoClient
+        from pymongo.errors import PyMongoError
+    except ImportError:
+        print("✗ pymongo is not installed - run: pip3 install -r requirements.txt")
+        return 1
+
+    try:
+        client = MongoClient(MONGO_URI, serverSelectionTimeoutMS=2000)
+        client.admin.command('ping')
+    except PyMongoError as e:
+        print(f"✗ Error connecting to MongoDB: {e}")
+        return 1
+
+    collection = client[MONGO_DATABASE][MONGO_COLLECTION]
+    service = CatalogService(collection)
+    count = service.load_from_collection()
+    print(f"✓ Loaded {count} products into the in-memory catalog")
+
+    # Same data without memoisation, so every call runs on the indexes
+    uncached = CatalogService(collection, cache_size=0)
+    uncached.load_from_collection()
+
+    shapes = [
+        ('Op 2: category + price filter',
+         lambda: mongo_category_price_filter(collection),
+         lambda svc: svc.find_products(category='Electronics', max_price=50000)),
+        ('Op 3: avg rating >= 4.0',
+         lambda: mongo_min_rating(collection),
+         lambda svc: svc.products_with_min_rating(4.0)),
+        ('Op 5: avg price by category',
+         lambda: mongo_category_price_summary(collection),
+         lambda svc: svc.category_price_summary()),
+    ]
+
+    # Only report a speedup for queries that return the same rows
+    mismatches = 0
+    for label, mongo_query, service_query in shapes:
+        if normalize(mongo_query()) == normalize(service_query(uncached)):
+            print(f"✓ {label}: results match MongoDB")
+        else:
+            print(f"✗ {label}: results differ from MongoDB")
+            mismatches += 1
+    if mismatches:
+        client.close()
+        return 1
+
+    print("\n" + "=" * 78)
+    print(f"CATALOG READ BENCHMARK ({ITERATIONS} iterations, mean latency)")
+    print("=" * 78)
+    print(f"{'Query':<32}{'MongoDB (us)':>13}{'Index (us)':>11}"
+          f"{'Cache (us)':>11}{'Speedup':>11}")
+    print("-" * 78)
+
+    for label, mongo_query, service_query in shapes:
+        mongo_us = time_query(mongo_query)
+        index_us = time_query(lambda: service_query(uncached))
+        cache_us = time_query(lambda: service_query(service))
+        print(f"{label:<32}{mongo_us:>13.1f}{index_us:>11.2f}{cache_us:>11.2f}"
+              f"{mongo_us / index_us:>10.0f}x")
+
+    print("-" * 78)
+    print("Speedup compares MongoDB with the uncached (index) path")
+    stats = service.cache_stats()
+    print(f"Cache hits: {stats['hits']}, misses: {stats['misses']}")
+
+    client.close()
+    return 0
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+if __name__ == "__main__":
+    sys.exit(run_benchmark())
@@ -0,0 +1,497 @@
+"""
+FlexiMart Catalog Read Service
+==============================
+Keeps a compact in-memory copy of the MongoDB 'products' collection and
+answers the common catalog read shapes from mongodb_operations.js without a
+database round trip:
+
+- Operation 2: category + price-range filter (name, price, stock)
+- Operation 3: products with average review rating above a threshold
+- Operation 5: average price and product count by category
+
+Secondary indexes are kept on category, subcategory, specifications.brand and
+price (sorted). Query results are memoised in a bounded LRU cache and the
+affected entries are invalidated whenever a product or review is written
+through this service. Writes made outside the service (mongosh, Operation 4
+in mongodb_operations.js, other applications) are not seen until refresh()
+or load_from_collection() is called.
+
+Author: Data Engineering Team
+Date: 2024
+"""
+
+import json
+from bisect import bisect_left, insort
+from collections import OrderedDict
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+CATALOG_FILE = 'products_catalog.json'
+
+# Maximum number of memoised query results (least recently used are evicted)
+MAX_CACHE_ENTRIES = 256
+
+# Only the fields needed by the supported query shapes are kept in memory
+CATALOG_PROJECTION = {
+    '_id': 0,
+    'product_id': 1,
+    'name': 1,
+    'category': 1,
+    'subcategory': 1,
+    'price': 1,
+    'stock': 1,
+    'specifications.brand': 1,
+    'reviews.rating': 1
+}
+
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+def _numeric(value):
+    """
+    Return value as a float if it is numeric, otherwise None.
+
+    Mirrors MongoDB, where $avg and range operators such as $lt ignore
+    missing, null and non-numeric values (booleans included).
+    """
+    if isinstance(value, bool) or not isinstance(value, (int, float)):
+        return None
+    return float(value)
+
+
+# ============================================================================
+# CATALOG SERVICE
+# ============================================================================
+
+class CatalogService:
+    """
+    In-memory catalog with secondary indexes and a query result cache.
+
+    Writes made through this service go to MongoDB first (when a collection
+    is attached) and then update the in-memory copy. Writes made directly
+    against the database are only picked up by refresh(product_id) or a
+    full load_from_collection().
+
+    Parameters:
+        collection: pymongo Collection for write-through, or None to run
+                    purely in memory (e.g. when loaded from the JSON file)
+        cache_size (int): Maximum memoised query results; 0 disables caching
+    """
+
+    def __init__(self, collection=None, cache_size=MAX_CACHE_ENTRIES):
+        self.collection = collection
+        self.cache_size = cache_size
+        self._next_seq = 0
+        self._clear()
+
+    def _clear(self):
+        """Reset all records, indexes and cached results."""
+        self._products = {}          # product_id -> compact record
+        self._by_category = {}       # category (None if missing) -> set of product_ids
+        self._by_subcategory = {}    # subcategory -> set of product_ids
+        self._by_brand = {}          # brand -> set of product_ids
+        self._by_price = []          # sorted list of (price_key, seq, product_id)
+        self._query_cache = OrderedDict()  # query key -> cached result (LRU)
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    # ------------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------------
+
+    def load_from_json(self, file_path=CATALOG_FILE):
+        """
+        Load the catalog from a JSON array file such as products_catalog.json.
+
+        Parameters:
+            file_path (str): Path to the JSON file
+
+        Returns:
+            int: Number of products loaded
+        """
+        with open(file_path, 'r', encoding='utf-8') as f:
+            documents = json.load(f)
+        return self.load_documents(documents)
+
+    def load_from_collection(self, collection=None):
+        """
+        Load the catalog from a MongoDB collection.
+
+        Parameters:
+            collection: pymongo Collection (defaults to the attached one)
+
+        Returns:
+            int: Number of products loaded
+        """
+        collection = collection if collection is not None else self.collection
+        return self.load_documents(collection.find({}, CATALOG_PROJECTION))
+
+    def refresh(self, product_id):
+        """
+        Re-read one product from the attached collection.
+
+        Use this after the product was changed outside the service. A product
+        that no longer exists in the database is removed from the catalog.
+
+        Parameters:
+            product_id (str): Product to reload
+
+        Returns:
+            bool: True if the product exists in the database
+
+        Raises:
+            ValueError: If no collection is attached to the service
+        """
+        if self.collection is None:
+            raise ValueError("refresh() needs a MongoDB collection attached "
+                             "to the CatalogService")
+
+        document = self.collection.find_one({'product_id': product_id},
+                                            CATALOG_PROJECTION)
+        # Compact before unindexing so the product keeps its natural order
+        record = self._compact(document) if document is not None else None
+        old = self._products.get(product_id)
+        categories = set()
+        if old is not None:
+            categories.add(old['category'])
+            self._unindex(old)
+        if record is not None:
+            categories.add(record['category'])
+            self._index(record)
+        self._invalidate(*categories)
+        return document is not None
+
+    def load_documents(self, documents):
+        """
+        Replace the catalog with the given product documents.
+
+        Parameters:
+            documents (iterable): Product documents; when a product_id
+                                  repeats, the last document wins
+
+        Returns:
+            int: Number of products loaded
+        """
+        self._clear()
+        for doc in documents:
+            record = self._compact(doc)
+            old = self._products.get(record['product_id'])
+            if old is not None:
+                # Duplicate product_id: last document wins
+                self._unindex(old)
+            self._index(record)
+        return len(self._products)
+
+    def _compact(self, doc):
+        """Build the compact record kept in memory for one product document."""
+        ratings = [_numeric(r.get('rating')) for r in doc.get('reviews', [])]
+        ratings = [rating for rating in ratings if rating is not None]
+        existing = self._products.get(doc['product_id'])
+        if existing is not None:
+            seq = existing['seq']
+        else:
+            seq = self._next_seq
+            self._next_seq += 1
+
+        return {
+            'seq': seq,  # preserves insertion (natural) order of results
+            'product_id': doc['product_id'],
+            'name': doc.get('name'),
+            'category': doc.get('category'),
+            'subcategory': doc.get('subcategory'),
+            'price': doc.get('price'),  # returned to callers unchanged
+            'price_key': _numeric(doc.get('price')),  # None if missing/non-numeric
+            'stock': doc.get('stock'),
+            'brand': (doc.get('specifications') or {}).get('brand'),
+            'rating_sum': sum(ratings),
+            'rating_count': len(ratings)
+        }
+
+    # ------------------------------------------------------------------------
+    # Index maintenance
+    # ------------------------------------------------------------------------
+
+    def _index(self, record):
+        product_id = record['product_id']
+        self._products[product_id] = record
+        # A missing category is indexed under None, like $group's null group
+        self._by_category.setdefault(record['category'], set()).add(product_id)
+        for index, key in ((self._by_subcategory, record['subcategory']),
+                           (self._by_brand, record['brand'])):
+            if key is not None:
+                index.setdefault(key, set()).add(product_id)
+        if record['price_key'] is not None:
+            insort(self._by_price, (record['price_key'], record['seq'], product_id))
+
+    def _unindex(self, record):
+        product_id = record['product_id']
+        del self._products[product_id]
+        for index, key in ((self._by_category, record['category']),
+                           (self._by_subcategory, record['subcategory']),
+                           (self._by_brand, record['brand'])):
+            ids = index.get(key)
+            if ids is not None:
+                ids.discard(product_id)
+                if not ids:
+                    del index[key]
+        if record['price_key'] is None:
+            return
+        entry = (record['price_key'], record['seq'], product_id)
+        pos = bisect_left(self._by_price, entry)
+        if pos < len(self._by_price) and self._by_price[pos] == entry:
+            del self._by_price[pos]
+
+    def _invalidate(self, *categories, ratings_only=False):
+        """
+        Drop cached results that may be affected by a write.
+
+        Product writes invalidate finds touching the given categories (and
+        any find without a category filter) plus all aggregates. Review
+        writes only change ratings, so only rating queries are dropped.
+        """
+        for key in list(self._query_cache):
+            shape = key[0]
+            if shape == 'min_rating':
+                stale = True
+            elif ratings_only:
+                stale = False
+            elif shape == 'find':
+                stale = key[1] is None or key[1] in categories
+            else:
+                stale = True
+            if stale:
+                del self._query_cache[key]
+
+    # ------------------------------------------------------------------------
+    # Read queries
+    # ------------------------------------------------------------------------
+
+    def _cached(self, key, compute):
+        result = self._query_cache.get(key)
+        if result is None:
+            self._cache_misses += 1
+            result = compute()
+            if self.cache_size > 0:
+                self._query_cache[key] = result
+                if len(self._query_cache) > self.cache_size:
+                    self._query_cache.popitem(last=False)
+        else:
+            self._cache_hits += 1
+            self._query_cache.move_to_end(key)
+        return [dict(row) for row in result]
+
+    def find_products(self, category=None, subcategory=None, brand=None,
+                      min_price=None, max_price=None):
+        """
+        Filter products by category, subcategory, brand and price range.
+
+        Equivalent to Operation 2, e.g.
+        find_products(category='Electronics', max_price=50000) matches
+        find({category: 'Electronics', price: {$lt: 50000}}). Products
+        without a numeric price never match a price bound.
+
+        Parameters:
+            category (str): Exact category match
+            subcategory (str): Exact subcategory match
+            brand (str): Exact specifications.brand match
+            min_price (float): Inclusive lower bound ($gte)
+            max_price (float): Exclusive upper bound ($lt)
+
+        Returns:
+            list: Dicts with name, price and stock in natural order
+        """
+        key = ('find', category, subcategory, brand, min_price, max_price)
+        return self._cached(key, lambda: self._find(
+            category, subcategory, brand, min_price, max_price))
+
+    def _find(self, category, subcategory, brand, min_price, max_price):
+        # Intersect equality indexes, smallest set first
+        candidates = None
+        equality = [(self._by_category, category),
+                    (self._by_subcategory, subcategory),
+                    (self._by_brand, brand)]
+        sets = [index.get(value, set()) for index, value in equality
+                if value is not None]
+        for ids in sorted(sets, key=len):
+            candidates = set(ids) if candidates is None else candidates & ids
+            if not candidates:
+                return []
+
+        if candidates is None and (min_price is not None or max_price is not None):
+            # No equality filter: take the price range straight from the
+            # sorted price index
+            lo = 0
+            hi = len(self._by_price)
+            if min_price is not None:
+                lo = bisect_left(self._by_price, (float(min_price),))
+            if max_price is not None:
+                hi = bisect_left(self._by_price, (float(max_price),))
+            records = [self._products[pid] for _, _, pid in self._by_price[lo:hi]]
+        else:
+            if candidates is None:
+                records = list(self._products.values())
+            else:
+                records = [self._products[pid] for pid in candidates]
+            if min_price is not None:
+                records = [r for r in records
+                           if r['price_key'] is not None and r['price_key'] >= min_price]
+            if max_price is not None:
+                records = [r for r in records
+                           if r['price_key'] is not None and r['price_key'] < max_price]
+
+        records.sort(key=lambda r: r['seq'])
+        return [{'name': r['name'], 'price': r['price'], 'stock': r['stock']}
+                for r in records]
+
+    def products_with_min_rating(self, min_rating=4.0):
+        """
+        Products whose average review rating is at least min_rating.
+
+        Equivalent to Operation 3.
+
+        Parameters:
+            min_rating (float): Minimum average rating
+
+        Returns:
+            list: Dicts with name, category and avg_rating, best rated first
+        """
+        return self._cached(('min_rating', min_rating),
+                            lambda: self._min_rating(min_rating))
+
+    def _min_rating(self, min_rating):
+        rows = []
+        for r in self._products.values():
+            if r['rating_count'] == 0:
+                continue
+            avg_rating = r['rating_sum'] / r['rating_count']
+            if avg_rating >= min_rating:
+                rows.append({'name': r['name'], 'category': r['category'],
+                             'avg_rating': avg_rating})
+        rows.sort(key=lambda row: row['avg_rating'], reverse=True)
+        return rows
+
+    def category_price_summary(self):
+        """
+        Average price and product count by category.
+
+        Equivalent to Operation 5. Like $avg, products without a numeric
+        price are counted but left out of the average, and products without
+        a category are grouped under category None ($group's null group).
+
+        Returns:
+            list: Dicts with category, avg_price and product_count,
+                  sorted by avg_price descending
+        """
+        return self._cached(('category_summary',), self._category_summary)
+
+    def _category_summary(self):
+        rows = []
+        for category, ids in self._by_category.items():
+            prices = [self._products[pid]['price_key'] for pid in ids]
+            prices = [price for price in prices if price is not None]
+            avg_price = round(sum(prices) / len(prices), 2) if prices else None
+            rows.append({'category': category,
+                         'avg_price': avg_price,
+                         'product_count': len(ids)})
+        # A null average sorts last, as in MongoDB's descending sort
+        rows.sort(key=lambda row: (row['avg_price'] is not None,
+                                   row['avg_price'] or 0), reverse=True)
+        return rows
+
+    # ------------------------------------------------------------------------
+    # Writes (write-through + invalidation)
+    # ------------------------------------------------------------------------
+
+    def upsert_product(self, document):
+        """
+        Insert or replace a product document.
+
+        Parameters:
+            document (dict): Full product document including product_id
+        """
+        product_id = document['product_id']
+        if self.collection is not None:
+            self.collection.replace_one({'product_id': product_id}, document,
+                                        upsert=True)
+
+        categories = {document.get('category')}
+        record = self._compact(document)
+        old = self._products.get(product_id)
+        if old is not None:
+            categories.add(old['category'])
+            self._unindex(old)
+        self._index(record)
+        self._invalidate(*categories)
+
+    def delete_product(self, product_id):
+        """
+        Remove a product.
+
+        Parameters:
+            product_id (str): Product to delete
+
+        Returns:
+            bool: True if the product was present in the catalog or database
+        """
+        deleted = False
+        if self.collection is not None:
+            deleted = self.collection.delete_one(
+                {'product_id': product_id}).deleted_count > 0
+
+        old = self._products.get(product_id)
+        if old is None:
+            return deleted
+        self._unindex(old)
+        self._invalidate(old['category'])
+        return True
+
+    def add_review(self, product_id, review):
+        """
+        Append a review to a product (Operation 4).
+
+        Parameters:
+            product_id (str): Product being reviewed
+            review (dict): Review document with at least a rating
+
+        Returns:
+            bool: True if the product exists
+        """
+        record = self._products.get(product_id)
+        if record is None and self.collection is None:
+            return False
+
+        if self.collection is not None:
+            result = self.collection.update_one({'product_id': product_id},
+                                                {'$push': {'reviews': review}})
+            if record is None or result.matched_count == 0:
+                # Not in memory (e.g. inserted outside the service), or gone
+                # from the database: resync this product from MongoDB
+                return self.refresh(product_id)
+
+        rating = _numeric(review.get('rating'))
+        if rating is not None:
+            record['rating_sum'] += rating
+            record['rating_count'] += 1
+        self._invalidate(ratings_only=True)
+        return True
+
+    # ------------------------------------------------------------------------
+    # Introspection
+    # ------------------------------------------------------------------------
+
+    def __len__(self):
+        return len(self._products)
+
+    def cache_stats(self):
+        """
+        Returns:
+            dict: Cache hits, misses and number of cached query results
+        """
+        return {'hits': self._cache_hits,
+                'misses': self._cache_misses,
+                'entries': len(self._query_cache)}
@@ -0,0 +1,307 @@
+"""
+FlexiMart Catalog Service Checks
+================================
+Loads products_catalog.json into CatalogService and checks its answers
+against the expected outputs in mongodb_operations.js, plus cache
+invalidation after writes. Needs no MongoDB server.
+
+Run with: python3 check_catalog_service.py
+
+Author: Data Engineering Team
+Date: 2024
+"""
+
+import copy
+import json
+import sys
+
+from catalog_service import CatalogService, CATALOG_FILE
+
+
+# ============================================================================
+# EXPECTED RESULTS (from mongodb_operations.js)
+# ============================================================================
+
+# Operation 2: Electronics with price < 50000
+EXPECTED_OP2 = [
+    {'name': 'Sony WH-1000XM5 Headphones', 'price': 29990, 'stock': 200},
+    {'name': 'Dell 27-inch 4K Monitor', 'price': 32999, 'stock': 60},
+    {'name': 'OnePlus Nord CE 3', 'price': 26999, 'stock': 180}
+]
+
+
+# ============================================================================
+# HELPER FUNCTIONS
+# ============================================================================
+
+class InMemoryCollection:
+    """Minimal stand-in for the pymongo Collection methods the service uses."""
+
+    class _Result:
+        def __init__(self, matched_count=0, deleted_count=0):
+            self.matched_count = matched_count
+            self.deleted_count = deleted_count
+
+    def __init__(self, documents):
+        self.documents = {doc['product_id']: copy.deepcopy(doc)
+                          for doc in documents}
+
+    def find(self, query=None, projection=None):
+        return [copy.deepcopy(doc) for doc in self.documents.values()]
+
+    def find_one(self, query, projection=None):
+        doc = self.documents.get(query['product_id'])
+        return copy.deepcopy(doc) if doc is not None else None
+
+    def replace_one(self, query, document, upsert=False):
+        self.documents[query['product_id']] = copy.deepcopy(document)
+
+    def update_one(self, query, update):
+        doc = self.documents.get(query['product_id'])
+        if doc is None:
+            return self._Result(matched_count=0)
+        for field, value in update['$push'].items():
+            doc.setdefault(field, []).append(copy.deepcopy(value))
+        return self._Result(matched_count=1)
+
+    def delete_one(self, query):
+        removed = self.documents.pop(query['product_id'], None)
+        return self._Result(deleted_count=1 if removed is not None else 0)
+
+
+def load_catalog():
+    with open(CATALOG_FILE, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def new_service(**kwargs):
+    service = CatalogService(**kwargs)
+    service.load_from_json()
+    return service
+
+
+def names(rows):
+    return [row['name'] for row in rows]
+
+
+# ============================================================================
+# CHECKS
+# ============================================================================
+
+def check_operation_2():
+    service = new_service()
+    return service.find_products(category='Electronics', max_price=50000) == EXPECTED_OP2
+
+
+def check_operation_2_price_unchanged():
+    # Prices are returned exactly as stored, not coerced to float
+    prices = {d['name']: d['price'] for d in load_catalog()}
+    service = new_service()
+    rows = service.find_products(category='Electronics', max_price=50000)
+    same_as_source = all(type(row['price']) is type(prices[row['name']])
+                         and row['price'] == prices[row['name']] for row in rows)
+
+    headphones = next(d for d in load_catalog() if d['product_id'] == 'ELEC003')
+    headphones['price'] = 29990
+    service.upsert_product(headphones)
+    row = next(row for row in service.find_products(category='Electronics', max_price=50000)
+               if row['name'] == headphones['name'])
+    return same_as_source and type(row['price']) is int and row['price'] == 29990
+
+
+def check_operation_5():
+    documents = load_catalog()
+    summary = new_service().category_price_summary()
+    for row in summary:
+        prices = [d['price'] for d in documents if d['category'] == row['category']]
+        if row['product_count'] != len(prices):
+            return False
+        if row['avg_price'] != round(sum(prices) / len(prices), 2):
+            return False
+    return [row['category'] for row in summary] == ['Electronics', 'Fashion']
+
+
+def check_operation_5_null_category():
+    # $group puts products with a missing or null category in a null group
+    documents = load_catalog()
+    documents.append({'product_id': 'X001', 'price': 5})
+    documents.append({'product_id': 'X002', 'category': None, 'price': 15})
+    service = CatalogService()
+    service.load_documents(documents)
+    summary = service.category_price_summary()
+    null_group = [row for row in summary if row['category'] is None]
+    return (sum(row['product_count'] for row in summary) == len(service) == 14
+            and null_group == [{'category': None, 'avg_price': 10.0, 'product_count': 2}])
+
+
+def check_price_index_matches_scan():
+    documents = load_catalog()
+    service = new_service()
+    expected = [d['name'] for d in documents if 1000 <= d['price'] < 30000]
+    return names(service.find_products(min_price=1000, max_price=30000)) == expected
+
+
+def check_upsert_changes_category():
+    service = new_service()
+    service.find_products(category='Electronics', max_price=50000)
+    service.find_products(category='Fashion', max_price=50000)
+    service.category_price_summary()
+
+    moved = next(d for d in load_catalog() if d['product_id'] == 'ELEC001')
+    moved['category'] = 'Fashion'
+    moved['price'] = 999
+    service.upsert_product(moved)
+
+    electronics = names(service.find_products(category='Electronics', max_price=50000))
+    fashion = names(service.find_products(category='Fashion', max_price=50000))
+    counts = {row['category']: row['product_count']
+              for row in service.category_price_summary()}
+    return (moved['name'] not in electronics
+            and moved['name'] in fashion
+            and counts == {'Electronics': 5, 'Fashion': 7})
+
+
+def check_delete_product():
+    service = new_service()
+    service.find_products(category='Electronics', max_price=50000)
+    service.category_price_summary()
+    deleted = service.delete_product('ELEC003')  # Sony WH-1000XM5 Headphones
+    rows = names(service.find_products(category='Electronics', max_price=50000))
+    counts = {row['category']: row['product_count']
+              for row in service.category_price_summary()}
+    return deleted and 'Sony WH-1000XM5 Headphones' not in rows and counts['Electronics'] == 5
+
+
+def check_add_review():
+    service = new_service()
+    before = len(service.products_with_min_rating(4.0))
+    service.add_review('ELEC001', {'rating': 1})
+    service.add_review('ELEC001', {'rating': 1})
+    service.add_review('ELEC001', {'rating': None})  # ignored, like $avg
+    after = names(service.products_with_min_rating(4.0))
+    return len(after) == before - 1 and 'Samsung Galaxy S21 Ultra' not in after
+
+
+def check_missing_and_null_prices():
+    documents = load_catalog()
+    documents[0] = dict(documents[0])
+    del documents[0]['price']
+    documents[1] = dict(documents[1], price=None, reviews=[{'rating': None}])
+    service = CatalogService()
+    service.load_documents(documents)
+
+    rows = names(service.find_products(max_price=50000))
+    electronics = next(row for row in service.category_price_summary()
+                       if row['category'] == 'Electronics')
+    priced = [d['price'] for d in documents
+              if d['category'] == 'Electronics' and d.get('price') is not None]
+    return (documents[0]['name'] not in rows
+            and documents[1]['name'] not in rows
+            and electronics['product_count'] == 6
+            and electronics['avg_price'] == round(sum(priced) / len(priced), 2))
+
+
+def check_duplicate_product_id():
+    documents = load_catalog()
+    documents.append(dict(documents[0], price=10, category='Fashion'))
+    service = CatalogService()
+    service.load_documents(documents)
+    return (len(service) == 12
+            and names(service.find_products(max_price=50000)).count(documents[0]['name']) == 1
+            and documents[0]['name'] not in names(service.find_products(category='Electronics')))
+
+
+def check_cache_is_bounded():
+    service = new_service(cache_size=8)
+    for i in range(100):
+        service.find_products(max_price=i + 0.5)
+    return service.cache_stats()['entries'] == 8
+
+
+def check_review_for_product_missing_from_memory():
+    documents = load_catalog()
+    collection = InMemoryCollection(documents)
+    service = CatalogService(collection)
+    service.load_documents(documents[1:])  # ELEC001 was inserted outside the service
+    added = service.add_review('ELEC001', {'rating': 5})
+    return added and len(service) == 12 and collection.documents['ELEC001']['reviews'][-1] == {'rating': 5}
+
+
+def check_refresh_after_external_write():
+    collection = InMemoryCollection(load_catalog())
+    service = CatalogService(collection)
+    service.load_from_collection()
+    service.find_products(category='Electronics', max_price=50000)
+
+    # Operation 4 style write made directly against the database
+    collection.documents['ELEC003']['price'] = 60000
+    service.refresh('ELEC003')
+    rows = names(service.find_products(category='Electronics', max_price=50000))
+    return 'Sony WH-1000XM5 Headphones' not in rows
+
+
+def check_refresh_keeps_natural_order():
+    collection = InMemoryCollection(load_catalog())
+    service = CatalogService(collection)
+    service.load_from_collection()
+    before = names(service.find_products(category='Electronics'))
+    collection.documents['ELEC003']['stock'] = 1
+    service.refresh('ELEC003')
+    return names(service.find_products(category='Electronics')) == before
+
+
+def check_refresh_without_collection():
+    try:
+        new_service().refresh('ELEC001')
+    except ValueError:
+        return True
+    return False
+
+
+def check_review_for_product_missing_from_database():
+    collection = InMemoryCollection(load_catalog())
+    service = CatalogService(collection)
+    service.load_from_collection()
+    del collection.documents['ELEC001']  # deleted outside the service
+    added = service.add_review('ELEC001', {'rating': 1})
+    return not added and 'Samsung Galaxy S21 Ultra' not in names(service.find_products())
+
+
+CHECKS = [
+    ('Operation 2 matches expected output', check_operation_2),
+    ('Operation 2 returns prices unchanged', check_operation_2_price_unchanged),
+    ('Operation 5 averages and counts', check_operation_5),
+    ('Operation 5 null category group', check_operation_5_null_category),
+    ('Sorted price index matches a full scan', check_price_index_matches_scan),
+    ('Upsert moving a product between categories', check_upsert_changes_category),
+    ('Delete invalidates finds and summary', check_delete_product),
+    ('Review invalidates rating query', check_add_review),
+    ('Missing/null prices ignored like MongoDB', check_missing_and_null_prices),
+    ('Duplicate product_id keeps one record', check_duplicate_product_id),
+    ('Query cache is bounded (LRU)', check_cache_is_bounded),
+    ('Review for product missing from memory', check_review_for_product_missing_from_memory),
+    ('refresh() picks up external writes', check_refresh_after_external_write),
+    ('refresh() keeps natural order', check_refresh_keeps_natural_order),
+    ('refresh() without a collection raises', check_refresh_without_collection),
+    ('Review for product missing from database', check_review_for_product_missing_from_database),
+]
+
+
+# ============================================================================
+# ENTRY POINT
+# ============================================================================
+
+def run_checks():
+    failures = 0
+    for label, check in CHECKS:
+        if check():
+            print(f"✓ {label}")
+        else:
+            print(f"✗ {label}")
+            failures += 1
+    print(f"\n{len(CHECKS) - failures}/{len(CHECKS)} checks passed")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(run_checks())